@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, font, colorchooser, filedialog
-from PIL import Image, ImageDraw, ImageFont, ImageGrab
+from PIL import Image, ImageDraw, ImageFont, ImageGrab, ImageTk
+import numpy as np
 import os
+import re
 import json
 import math
+import functools
 import wave
-import struct
-import threading
+import concurrent.futures
 
 # Try to import audio playback libraries
 try:
@@ -21,6 +23,20 @@ try:
 except ImportError:
     HAS_SIMPLEAUDIO = False
 
+# Win32 GDI for reading single screen pixels without a screen grab
+try:
+    import ctypes
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+    _user32.GetDC.restype = ctypes.c_void_p
+    _user32.GetDC.argtypes = [ctypes.c_void_p]
+    _user32.ReleaseDC.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    _gdi32.GetPixel.restype = ctypes.c_uint32
+    _gdi32.GetPixel.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+    HAS_WIN32_GDI = True
+except (ImportError, AttributeError):
+    HAS_WIN32_GDI = False
+
 
 # International Morse Code reference
 MORSE_CODE = {
@@ -40,17 +56,22 @@ MORSE_CODE = {
 # Reverse mapping for Morse to text
 MORSE_TO_TEXT = {v: k for k, v in MORSE_CODE.items()}
 
+# Size of the sine wavetable used for tone synthesis (must be a power of two)
+SINE_TABLE_SIZE = 4096
+
+class _MorseTranslation(dict):
+    """str.translate table that drops characters with no Morse equivalent"""
+    
+    def __missing__(self, key):
+        return None
+
+# Per-character translation table; each code carries its trailing letter gap
+_MORSE_TRANSLATION = _MorseTranslation({ord(k): v + ' ' for k, v in MORSE_CODE.items()})
+
 def text_to_morse(text):
     """Convert text to Morse code. Words separated by /"""
-    result = []
-    for word in text.upper().split():
-        morse_word = []
-        for char in word:
-            if char in MORSE_CODE:
-                morse_word.append(MORSE_CODE[char])
-        if morse_word:
-            result.append(' '.join(morse_word))
-    return ' / '.join(result)
+    words = (word.translate(_MORSE_TRANSLATION).rstrip() for word in text.upper().split())
+    return ' / '.join(word for word in words if word)
 
 def morse_to_text(morse):
     """Convert Morse code to text. Words separated by /"""
@@ -77,6 +98,13 @@ class MorseAudioGenerator:
         self.frequency = frequency  # Tone frequency in Hz (standard: 600-800 Hz)
         self.wpm = wpm  # Words per minute
         self.sample_rate = sample_rate
+        self._play_obj = None  # Active simpleaudio playback, if any
+        self._stopped = False  # Set by stop(); no playback starts afterwards
+        
+        # One period of sine, indexed by a phase accumulator in generate_tone
+        self._sine_table = np.sin(
+            2 * np.pi * np.arange(SINE_TABLE_SIZE) / SINE_TABLE_SIZE
+        ).astype(np.float32)
         
         # Calculate timing based on WPM
         # Standard word "PARIS" = 50 time units
@@ -86,102 +114,125 @@ class MorseAudioGenerator:
         self.element_space = self.dit_duration  # Space between elements
         self.letter_space = self.dit_duration * 3  # Space between letters
         self.word_space = self.dit_duration * 7  # Space between words
+        
+        # Shared read-only silence buffers for the three standard gaps
+        self._silences = {}
+        for duration in (self.element_space, self.letter_space, self.word_space):
+            silence = np.zeros(int(self.sample_rate * duration), dtype=np.float32)
+            silence.flags.writeable = False
+            self._silences[duration] = silence
+        
+        self._build_buffers()
+    
+    def _build_buffers(self):
+        """Precompute the tone and gap buffers reused for every element"""
+        self._dit = self.generate_tone(self.dit_duration)
+        self._dah = self.generate_tone(self.dah_duration)
+        self._element_gap = self.generate_silence(self.element_space)
+        self._letter_gap = self.generate_silence(self.letter_space)
+        self._word_gap = self.generate_silence(self.word_space)
+        
+        # Every element carries its trailing element gap, so separators only
+        # add the remainder of the letter/word gap on top of it
+        self._token_map = {
+            '.': np.concatenate([self._dit, self._element_gap]),
+            '-': np.concatenate([self._dah, self._element_gap]),
+        }
+        self._letter_sep = self._letter_gap[len(self._element_gap):]
+        self._word_sep = self._word_gap[len(self._element_gap):]
     
     def generate_tone(self, duration):
         """Generate a sine wave tone"""
         num_samples = int(self.sample_rate * duration)
-        samples = []
-        for i in range(num_samples):
-            # Apply envelope to reduce clicks
-            t = i / self.sample_rate
-            envelope = 1.0
-            fade_time = 0.005  # 5ms fade
-            if t < fade_time:
-                envelope = t / fade_time
-            elif t > duration - fade_time:
-                envelope = (duration - t) / fade_time
-            
-            sample = envelope * math.sin(2 * math.pi * self.frequency * t)
-            samples.append(sample)
-        return samples
+        phase_inc = self.frequency * SINE_TABLE_SIZE / self.sample_rate
+        phase = (np.arange(num_samples) * phase_inc).astype(np.int64)
+        wave_data = self._sine_table[phase & (SINE_TABLE_SIZE - 1)]
+        
+        # Apply envelope to reduce clicks: a trapezoid clipped at full volume
+        fade_time = 0.005  # 5ms fade
+        t = np.arange(num_samples, dtype=np.float32) / self.sample_rate
+        envelope = np.minimum(np.minimum(t, duration - t) * (1.0 / fade_time), 1.0)
+        
+        return wave_data * envelope
     
     def generate_silence(self, duration):
         """Generate silence"""
+        silence = self._silences.get(duration)
+        if silence is not None:
+            return silence
         num_samples = int(self.sample_rate * duration)
-        return [0.0] * num_samples
+        return np.zeros(num_samples, dtype=np.float32)
     
     def morse_to_audio_samples(self, morse_code):
         """Convert Morse code string to audio samples"""
-        samples = []
-        
-        i = 0
-        while i < len(morse_code):
-            char = morse_code[i]
-            
-            if char == '.':
-                samples.extend(self.generate_tone(self.dit_duration))
-                # Add element space if next char is part of same letter
-                if i + 1 < len(morse_code) and morse_code[i + 1] in '.-':
-                    samples.extend(self.generate_silence(self.element_space))
-            elif char == '-':
-                samples.extend(self.generate_tone(self.dah_duration))
-                # Add element space if next char is part of same letter
-                if i + 1 < len(morse_code) and morse_code[i + 1] in '.-':
-                    samples.extend(self.generate_silence(self.element_space))
-            elif char == ' ':
-                # Check for word separator " / "
-                if i + 2 < len(morse_code) and morse_code[i:i+3] == ' / ':
-                    samples.extend(self.generate_silence(self.word_space))
-                    i += 2  # Skip the " / "
-                else:
-                    # Space between letters
-                    samples.extend(self.generate_silence(self.letter_space))
-            elif char == '/':
-                # Word separator (handled above with spaces)
-                pass
-            
-            i += 1
-        
-        return samples
+        chunks = []
+        separator = self._letter_sep
+        
+        # Tokens are whole letters ("...", "-.-") or word separators ("/")
+        for token in re.findall(r'[.-]+|/', morse_code):
+            if token == '/':
+                separator = self._word_sep
+                continue
+            if chunks:
+                chunks.append(separator)
+            chunks.extend(self._token_map[c] for c in token)
+            separator = self._letter_sep
+        
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        # Drop the element gap trailing the final element
+        samples = np.concatenate(chunks)
+        return samples[:len(samples) - len(self._element_gap)]
     
     def samples_to_wav_data(self, samples):
         """Convert samples to WAV byte data"""
-        # Normalize and convert to 16-bit integers
-        max_val = max(abs(s) for s in samples) if samples else 1
-        if max_val == 0:
-            max_val = 1
-        
-        audio_data = b''
-        for sample in samples:
-            normalized = int((sample / max_val) * 32767 * 0.8)  # 80% volume
-            audio_data += struct.pack('<h', normalized)
-        
-        return audio_data
+        samples = np.asarray(samples, dtype=np.float32)
+        # Tones are built within [-1, 1], so a fixed gain replaces normalization
+        gain = 32767 * 0.8  # 80% volume
+        pcm = np.clip(samples * gain, -32768, 32767).astype('<i2')
+        return pcm.tobytes()
+    
+    def write_wav_data(self, audio_data, filename):
+        """Write 16-bit mono PCM byte data to a WAV file"""
+        # Declaring the frame count up front means the RIFF header is written
+        # once and never patched, so the data goes out as one buffered write
+        with open(filename, 'wb', buffering=1 << 20) as raw_file, \
+                wave.open(raw_file, 'wb') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(self.sample_rate)
+            wav_file.setnframes(len(audio_data) // 2)
+            wav_file.writeframesraw(audio_data)
     
     def save_wav(self, morse_code, filename):
         """Save Morse code audio to WAV file"""
         samples = self.morse_to_audio_samples(morse_code)
         audio_data = self.samples_to_wav_data(samples)
-        
-        with wave.open(filename, 'w') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data)
+        self.write_wav_data(audio_data, filename)
     
     def play_morse(self, morse_code, temp_file=None):
         """Play Morse code audio"""
         samples = self.morse_to_audio_samples(morse_code)
         audio_data = self.samples_to_wav_data(samples)
+        if self._stopped:
+            return None
         
         if HAS_SIMPLEAUDIO:
             # Use simpleaudio if available
             wave_obj = sa.WaveObject(audio_data, 1, 2, self.sample_rate)
-            play_obj = wave_obj.play()
-            play_obj.wait_done()
+            play_obj = self._play_obj = wave_obj.play()
+            try:
+                # stop() may have run between the check above and play()
+                if self._stopped:
+                    play_obj.stop()
+                play_obj.wait_done()
+            finally:
+                self._play_obj = None
         elif HAS_WINSOUND and temp_file:
             # Use winsound on Windows
-            self.save_wav(morse_code, temp_file)
+            self.write_wav_data(audio_data, temp_file)
+            if self._stopped:
+                return None
             winsound.PlaySound(temp_file, winsound.SND_FILENAME)
             try:
                 os.remove(temp_file)
@@ -190,24 +241,70 @@ class MorseAudioGenerator:
         else:
             # Fallback: save to temp file and try to play
             if temp_file:
-                self.save_wav(morse_code, temp_file)
+                self.write_wav_data(audio_data, temp_file)
                 return temp_file
         return None
+    
+    def stop(self):
+        """Stop playback started by play_morse and keep later calls from playing"""
+        self._stopped = True
+        play_obj = self._play_obj
+        if play_obj is not None:
+            play_obj.stop()
+        if HAS_WINSOUND:
+            winsound.PlaySound(None, 0)
+
+
+@functools.lru_cache(maxsize=64)
+def _pil_font(font_path, size):
+    """Load a TrueType font, reusing the parsed face for repeated (path, size) pairs"""
+    return ImageFont.truetype(font_path, size)
+
+
+def _measure_widths(pil_font, texts):
+    """Map each distinct non-empty string in texts to its advance width, measuring once"""
+    return {text: pil_font.getlength(text) for text in set(texts) if text}
+
+
+def _screen_pixel(x, y):
+    """Return the (r, g, b) color of the screen pixel at x, y"""
+    if HAS_WIN32_GDI:
+        hdc = _user32.GetDC(None)
+        try:
+            colorref = _gdi32.GetPixel(hdc, x, y)
+        finally:
+            _user32.ReleaseDC(None, hdc)
+        if colorref != 0xFFFFFFFF:  # CLR_INVALID
+            return (colorref & 0xFF, (colorref >> 8) & 0xFF, (colorref >> 16) & 0xFF)
+    
+    img = ImageGrab.grab(bbox=(x, y, x+1, y+1))
+    return img.getpixel((0, 0))[:3]
 
 
 class TextOverlayApp:
+    # Font directory listings, read once per session by _list_font_dir
+    _font_dir_listings = {}
+    
+    # Resolved font paths persisted across sessions, keyed by normalized family name
+    _font_path_cache = {}
+    _font_path_cache_dirty = False
+    # Bumped whenever _scan_font_path can pick a different file, invalidating old caches
+    _font_path_cache_version = 2
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Text Overlay Creator")
         self.root.geometry("1200x900")
         
         self.config_file = os.path.join(os.path.expanduser("~"), ".text_overlay_config.json")
+        self.font_cache_file = os.path.join(os.path.expanduser("~"), ".text_overlay_font_cache.json")
         
         # Text properties
         self.text_content = "Double-click to edit\nLine 2\nLine 3"
         self.font_family = "Arial"
         self.font_size = 72
         self.font_color = "#FFFFFF"
+        self.font_color_rgba = (255, 255, 255, 255)
         self.text_x = 960
         self.text_y = 540
         self.flip_h = False
@@ -220,15 +317,34 @@ class TextOverlayApp:
         self.morse_wpm = 20  # Words per minute
         self.morse_generator = MorseAudioGenerator(self.morse_frequency, self.morse_wpm)
         self.is_playing = False
+        # Single persistent worker for audio playback, and the generator it is using
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._playing_generator = None
+        self._closing = False
         
         # Load saved settings
         self.load_config()
+        self.load_font_cache()
         
         # Canvas scaling
         self.scale = 1.0
         self.canvas_width = 1920
         self.canvas_height = 1080
         
+        # Prerendered checkerboard background, rebuilt only when the scale changes
+        self._checker_img = None
+        self._checker_key = None
+        
+        # Rasterized text block for the canvas preview and the key it was built for
+        self._text_img = None
+        self._text_img_key = None
+        
+        # Pending _debounce callbacks: redraw, text widget read, config write, refit
+        self._redraw_after_id = None
+        self._text_after_id = None
+        self._save_after_id = None
+        self._resize_after_id = None
+        
         # Dragging state
         self.dragging = False
         self.resizing = False
@@ -236,6 +352,17 @@ class TextOverlayApp:
         self.drag_start_y = 0
         self.resize_handle = None
         
+        # (corner, x1, y1, x2, y2) hit areas of the drawn resize handles
+        self._handle_rects = []
+        
+        # Drag rendering is throttled to one frame per _flush_drag
+        self._drag_dirty = False
+        self._drag_scheduled = False
+        self._drawn_text_pos = (self.text_x, self.text_y)
+        
+        # Last text written to the status label
+        self._last_status = None
+        
         # Dropper state
         self.dropper_active = False
         
@@ -252,7 +379,7 @@ class TextOverlayApp:
                     config = json.load(f)
                     self.font_family = config.get('font_family', self.font_family)
                     self.font_size = config.get('font_size', self.font_size)
-                    self.font_color = config.get('font_color', self.font_color)
+                    self.set_font_color(config.get('font_color', self.font_color))
                     self.text_align = config.get('text_align', self.text_align)
                     self.line_spacing = config.get('line_spacing', self.line_spacing)
                     self.morse_frequency = config.get('morse_frequency', self.morse_frequency)
@@ -278,9 +405,49 @@ class TextOverlayApp:
         except:
             pass
             
+    def load_font_cache(self):
+        """Load font paths resolved in previous sessions"""
+        try:
+            if os.path.exists(self.font_cache_file):
+                with open(self.font_cache_file, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == TextOverlayApp._font_path_cache_version:
+                    TextOverlayApp._font_path_cache.update(data['paths'])
+        except:
+            pass
+    
+    def save_font_cache(self):
+        """Save resolved font paths if any were added this session"""
+        if not TextOverlayApp._font_path_cache_dirty:
+            return
+        try:
+            with open(self.font_cache_file, 'w') as f:
+                json.dump({
+                    'version': TextOverlayApp._font_path_cache_version,
+                    'paths': TextOverlayApp._font_path_cache,
+                }, f)
+            TextOverlayApp._font_path_cache_dirty = False
+        except:
+            pass
+    
+    def _schedule_save(self):
+        """Write the config once settings have stopped changing for a moment"""
+        self._debounce('_save_after_id', 500, self.save_config)
+            
     def on_close(self):
         """Handle window close"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         self.save_config()
+        self.save_font_cache()
+        
+        # The executor's worker is joined at interpreter exit, so end playback now
+        self._closing = True
+        generator = self._playing_generator
+        if generator is not None:
+            generator.stop()
+        self._audio_executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
         
     def setup_ui(self):
@@ -373,7 +540,8 @@ class TextOverlayApp:
         self.text_entry = tk.Text(text_frame, height=4, width=80, wrap=tk.WORD)
         self.text_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.text_entry.insert("1.0", self.text_content)
-        self.text_entry.bind("<KeyRelease>", lambda e: self.on_text_change())
+        self.text_entry.edit_modified(False)
+        self.text_entry.bind("<<Modified>>", self.on_text_modified)
         
         scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.text_entry.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -451,6 +619,18 @@ class TextOverlayApp:
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
         self.canvas.bind("<Double-Button-1>", self.on_double_click)
+        
+        # Selection box and resize handles are created once and moved with coords
+        self._sel_box = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="#00AAFF", width=2, dash=(5, 5),
+            state=tk.HIDDEN, tags="text_box"
+        )
+        self._handles = {}
+        for corner in ("nw", "ne", "sw", "se"):
+            self._handles[corner] = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill="#00AAFF", outline="white",
+                state=tk.HIDDEN, tags=f"resize_handle {corner}"
+            )
     
     def on_freq_change(self):
         """Handle frequency change"""
@@ -458,7 +638,7 @@ class TextOverlayApp:
             self.morse_frequency = int(self.freq_var.get())
             self.morse_frequency = max(300, min(1200, self.morse_frequency))
             self.morse_generator = MorseAudioGenerator(self.morse_frequency, self.morse_wpm)
-            self.save_config()
+            self._schedule_save()
         except:
             pass
     
@@ -468,7 +648,7 @@ class TextOverlayApp:
             self.morse_wpm = int(self.wpm_var.get())
             self.morse_wpm = max(5, min(40, self.morse_wpm))
             self.morse_generator = MorseAudioGenerator(self.morse_frequency, self.morse_wpm)
-            self.save_config()
+            self._schedule_save()
         except:
             pass
     
@@ -498,24 +678,39 @@ class TextOverlayApp:
         self.play_btn.config(text="Playing...", state=tk.DISABLED)
         self.morse_status.set("Playing...")
         
+        # Set before submitting so on_close can stop a job still queued or synthesizing
+        generator = self._playing_generator = self.morse_generator
+        
         def play_thread():
+            if self._closing:
+                return
             try:
                 temp_file = os.path.join(os.path.expanduser("~"), ".temp_morse.wav")
-                result = self.morse_generator.play_morse(morse_code, temp_file)
+                result = generator.play_morse(morse_code, temp_file)
                 if result:
                     # Fallback: file was saved but couldn't play
-                    self.root.after(0, lambda: self.morse_status.set(f"Audio saved to {result}"))
+                    self._post_to_ui(lambda: self.morse_status.set(f"Audio saved to {result}"))
             except Exception as e:
-                self.root.after(0, lambda: self.morse_status.set(f"Error: {str(e)[:30]}"))
+                message = f"Error: {str(e)[:30]}"
+                self._post_to_ui(lambda: self.morse_status.set(message))
             finally:
-                self.root.after(0, self.finish_playing)
+                self._post_to_ui(self.finish_playing)
         
-        thread = threading.Thread(target=play_thread, daemon=True)
-        thread.start()
+        self._audio_executor.submit(play_thread)
+    
+    def _post_to_ui(self, callback):
+        """Run callback on the Tk thread unless the window is closing"""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, callback)
+        except (tk.TclError, RuntimeError):
+            pass
     
     def finish_playing(self):
         """Reset play button after audio finishes"""
         self.is_playing = False
+        self._playing_generator = None
         self.play_btn.config(text="▶ Play", state=tk.NORMAL)
         if "Playing" in self.morse_status.get():
             self.morse_status.set("Done")
@@ -575,8 +770,8 @@ class TextOverlayApp:
     def set_align(self, align):
         self.text_align = align
         self.update_align_buttons()
-        self.save_config()
-        self.update_canvas()
+        self._schedule_save()
+        self._schedule_redraw()
     
     def update_align_buttons(self):
         for btn, val in [(self.align_left_btn, "left"), (self.align_center_btn, "center"), (self.align_right_btn, "right")]:
@@ -589,18 +784,32 @@ class TextOverlayApp:
         try:
             self.line_spacing = float(self.spacing_var.get())
             self.line_spacing = max(0.5, min(3.0, self.line_spacing))
-            self.save_config()
-            self.update_canvas()
+            self._schedule_save()
+            self._schedule_redraw()
         except:
             pass
     
     def on_resize(self, event=None):
-        if hasattr(self, '_resize_after_id') and self._resize_after_id is not None:
+        self._debounce('_resize_after_id', 50, self.fit_canvas)
+    
+    def _debounce(self, attr_name, delay, callback):
+        """Run callback after delay ms, replacing any run still pending under attr_name"""
+        after_id = getattr(self, attr_name)
+        if after_id is not None:
             try:
-                self.root.after_cancel(self._resize_after_id)
+                self.root.after_cancel(after_id)
             except:
                 pass
-        self._resize_after_id = self.root.after(50, self.fit_canvas)
+        
+        def fire():
+            setattr(self, attr_name, None)
+            callback()
+        
+        setattr(self, attr_name, self.root.after(delay, fire))
+    
+    def _schedule_redraw(self, delay=30):
+        """Coalesce bursts of edits into a single update_canvas call"""
+        self._debounce('_redraw_after_id', delay, self.update_canvas)
     
     def fit_canvas(self):
         self.canvas_container.update_idletasks()
@@ -622,93 +831,135 @@ class TextOverlayApp:
         self.update_canvas()
     
     def draw_checkerboard(self):
-        self.canvas.delete("checker")
         checker_size = max(10, int(20 * self.scale))
         
         display_width = int(1920 * self.scale)
         display_height = int(1080 * self.scale)
         
-        for y in range(0, display_height, checker_size):
-            for x in range(0, display_width, checker_size):
-                color = "#CCCCCC" if (x // checker_size + y // checker_size) % 2 == 0 else "#999999"
-                self.canvas.create_rectangle(x, y, x + checker_size, y + checker_size, 
-                                          fill=color, outline="", tags="checker")
+        key = (display_width, display_height, checker_size)
+        if key == self._checker_key and self.canvas.find_withtag("checker"):
+            return
+        
+        h_tiles = -(-display_height // checker_size)
+        w_tiles = -(-display_width // checker_size)
+        mask = np.add.outer(np.arange(h_tiles), np.arange(w_tiles)) & 1
+        tiles = np.where(mask, 0x99, 0xCC).astype(np.uint8)
+        pixels = np.repeat(np.repeat(tiles, checker_size, 0), checker_size, 1)
+        board = pixels[:display_height, :display_width]
+        
+        self._checker_img = ImageTk.PhotoImage(Image.fromarray(board, "L"))
+        self._checker_key = key
+        
+        self.canvas.delete("checker")
+        self.canvas.create_image(0, 0, image=self._checker_img, anchor="nw", tags="checker")
+        self.canvas.tag_lower("checker")
+    
+    def _display_lines(self):
+        """Return the text lines as drawn, mirrored when flip_h is set"""
+        if self.flip_h:
+            # Reversing the whole buffer reverses each line and the line order
+            return self.text_content[::-1].split('\n')[::-1]
+        return self.text_content.split('\n')
+    
+    def _display_chars(self):
+        """Return the characters stacked in vertical mode, reversed when flip_h is set"""
+        chars = list(self.text_content.replace('\n', ''))
+        if self.flip_h:
+            chars.reverse()
+        return chars
+    
+    def _get_preview_font(self, size):
+        """Return the PIL font used for the canvas preview"""
+        # Path lookup and font loading are both cached (and bounded) at module level
+        font_path = self.find_font_path(self.font_family)
+        candidates = [font_path] if font_path else []
+        candidates += ["arial.ttf", "Arial.ttf", "segoeui.ttf", "tahoma.ttf",
+                       "C:/Windows/Fonts/arial.ttf"]
+        for candidate in candidates:
+            try:
+                return _pil_font(candidate, size)
+            except:
+                continue
+        return ImageFont.load_default()
+    
+    def _render_text_image(self, scaled_size, draft=False):
+        """Rasterize the text block into a cached (PhotoImage, anchor), or None if empty"""
+        key = (self.text_content, self.font_family, scaled_size, self.font_color,
+               self.text_align, self.line_spacing, self.flip_h, self.vertical_stack, draft)
+        if key == self._text_img_key:
+            return self._text_img
+        
+        # Drafts are rasterized at half size and upscaled without filtering
+        render_scale = 2 if draft else 1
+        pil_font = self._get_preview_font(max(1, scaled_size // render_scale))
+        ascent, descent = pil_font.getmetrics()
+        linespace = ascent + descent
+        line_height = linespace * self.line_spacing
+        
+        items = self._display_chars() if self.vertical_stack else self._display_lines()
+        
+        text_img = None
+        if any(items):
+            item_widths = _measure_widths(pil_font, items)
+            widths = [item_widths.get(item, 0) for item in items]
+            # Tight line spacing lets glyphs overhang the first and last rows
+            pad = max(0.0, (linespace - line_height) / 2)
+            img_width = max(1, math.ceil(max(widths)))
+            img_height = max(1, math.ceil(line_height * len(items) + 2 * pad))
+            
+            # Fraction of each row's spare width placed left of the text
+            if self.vertical_stack:
+                align_frac = 0.5
+            else:
+                align_frac = {"left": 0.0, "right": 1.0}.get(self.text_align, 0.5)
+            first_y = pad + (line_height - linespace) / 2
+            
+            img = Image.new("RGBA", (img_width, img_height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            for i, item in enumerate(items):
+                if item:
+                    item_x = (img_width - widths[i]) * align_frac
+                    draw.text((item_x, first_y + i * line_height), item,
+                              font=pil_font, fill=self.font_color)
+            if render_scale != 1:
+                img = img.resize((img_width * render_scale, img_height * render_scale),
+                                 Image.NEAREST)
+            
+            if self.vertical_stack:
+                anchor = "center"
+            else:
+                anchor = {"left": "w", "right": "e"}.get(self.text_align, "center")
+            text_img = (ImageTk.PhotoImage(img), anchor)
+        
+        self._text_img = text_img
+        self._text_img_key = key
+        return text_img
     
     def update_canvas(self):
         self.draw_checkerboard()
         
         self.canvas.delete("text_element")
-        self.canvas.delete("text_box")
-        self.canvas.delete("resize_handle")
         
         scaled_x = self.text_x * self.scale
         scaled_y = self.text_y * self.scale
         scaled_size = max(8, int(self.font_size * self.scale))
         
-        try:
-            tk_font = font.Font(family=self.font_family, size=scaled_size)
-        except:
-            tk_font = font.Font(family="Arial", size=scaled_size)
-        
-        lines = self.text_content.split('\n')
-        if self.flip_h:
-            lines = [line[::-1] for line in lines]
-        
-        line_height = tk_font.metrics('linespace') * self.line_spacing
-        total_height = line_height * len(lines)
-        start_y = scaled_y - total_height / 2 + line_height / 2
-        
-        if self.vertical_stack:
-            all_chars = list(self.text_content.replace('\n', ''))
-            if self.flip_h:
-                all_chars = all_chars[::-1]
-            
-            char_height = tk_font.metrics('linespace') * self.line_spacing
-            total_char_height = char_height * len(all_chars)
-            char_start_y = scaled_y - total_char_height / 2 + char_height / 2
-            
-            for i, char in enumerate(all_chars):
-                char_y = char_start_y + i * char_height
-                self.canvas.create_text(
-                    scaled_x, char_y,
-                    text=char,
-                    font=tk_font,
-                    fill=self.font_color,
-                    anchor="center",
-                    tags="text_element"
-                )
-        else:
-            for i, line in enumerate(lines):
-                line_y = start_y + i * line_height
-                
-                if self.text_align == "left":
-                    anchor = "w"
-                    line_x = scaled_x
-                elif self.text_align == "right":
-                    anchor = "e"
-                    line_x = scaled_x
-                else:
-                    anchor = "center"
-                    line_x = scaled_x
-                
-                self.canvas.create_text(
-                    line_x, line_y,
-                    text=line,
-                    font=tk_font,
-                    fill=self.font_color,
-                    anchor=anchor,
-                    tags="text_element"
-                )
+        # Interactive drags get a cheap draft; mouse-up redraws at full quality
+        draft = self.dragging or self.resizing
+        text_img = self._render_text_image(scaled_size, draft)
+        if text_img is not None:
+            image, anchor = text_img
+            self.canvas.create_image(scaled_x, scaled_y, image=image, anchor=anchor,
+                                     tags="text_element")
+        # Drag flushes move the drawn items relative to this position
+        self._drawn_text_pos = (self.text_x, self.text_y)
         
         bbox = self.canvas.bbox("text_element")
         if bbox:
             x1, y1, x2, y2 = bbox
-            padding = 5;
+            padding = 5
             
-            self.canvas.create_rectangle(
-                x1 - padding, y1 - padding, x2 + padding, y2 + padding,
-                outline="#00AAFF", width=2, dash=(5, 5), tags="text_box"
-            )
+            self.canvas.coords(self._sel_box, x1 - padding, y1 - padding, x2 + padding, y2 + padding)
             
             handle_size = 8
             handles = [
@@ -718,20 +969,40 @@ class TextOverlayApp:
                 (x2 + padding, y2 + padding, "se"),
             ]
             
+            # Handles are hit-tested with a 5px margin around their drawn square
+            reach = handle_size//2 + 5
+            self._handle_rects = []
             for hx, hy, corner in handles:
-                self.canvas.create_rectangle(
+                self.canvas.coords(
+                    self._handles[corner],
                     hx - handle_size//2, hy - handle_size//2,
                     hx + handle_size//2, hy + handle_size//2,
-                    fill="#00AAFF", outline="white", tags=f"resize_handle {corner}"
                 )
+                self._handle_rects.append((corner, hx - reach, hy - reach, hx + reach, hy + reach))
+            
+            self.canvas.itemconfig("text_box", state=tk.NORMAL)
+            self.canvas.itemconfig("resize_handle", state=tk.NORMAL)
+            self.canvas.tag_raise("text_box")
+            self.canvas.tag_raise("resize_handle")
+        else:
+            self.canvas.itemconfig("text_box", state=tk.HIDDEN)
+            self.canvas.itemconfig("resize_handle", state=tk.HIDDEN)
+            self._handle_rects = []
         
+        self.update_status_text()
+    
+    def update_status_text(self):
         status = ""
         if self.flip_h:
             status += " [H-Flipped]"
         if self.vertical_stack:
             status += " [Vertical]"
-        line_count = len(self.text_content.split('\n'))
-        self.pos_var.set(f"Position: X={self.text_x}, Y={self.text_y} | Size: {self.font_size}pt | Lines: {line_count}{status}")
+        line_count = self.text_content.count('\n') + 1
+        status_text = f"Position: X={self.text_x}, Y={self.text_y} | Size: {self.font_size}pt | Lines: {line_count}{status}"
+        # Identical text would still make Tk redraw the label
+        if status_text != self._last_status:
+            self._last_status = status_text
+            self.pos_var.set(status_text)
     
     def toggle_flip_h(self):
         self.flip_h = not self.flip_h
@@ -752,15 +1023,10 @@ class TextOverlayApp:
         cx = event.x
         cy = event.y
         
-        items = self.canvas.find_overlapping(cx-5, cy-5, cx+5, cy+5)
-        for item in items:
-            tags = self.canvas.gettags(item)
-            if "resize_handle" in tags:
+        for corner, x1, y1, x2, y2 in self._handle_rects:
+            if x1 <= cx <= x2 and y1 <= cy <= y2:
                 self.resizing = True
-                for tag in tags:
-                    if tag in ["nw", "ne", "sw", "se"]:
-                        self.resize_handle = tag
-                        break
+                self.resize_handle = corner
                 self.drag_start_x = cx
                 self.drag_start_y = cy
                 return
@@ -772,6 +1038,7 @@ class TextOverlayApp:
                 self.dragging = True
                 self.drag_start_x = cx - (self.text_x * self.scale)
                 self.drag_start_y = cy - (self.text_y * self.scale)
+                self._drawn_text_pos = (self.text_x, self.text_y)
     
     def on_mouse_drag(self, event):
         if self.dropper_active:
@@ -781,13 +1048,16 @@ class TextOverlayApp:
         cy = event.y
         
         if self.dragging:
+            old_pos = (self.text_x, self.text_y)
             self.text_x = int((cx - self.drag_start_x) / self.scale)
             self.text_y = int((cy - self.drag_start_y) / self.scale)
             
             self.text_x = max(0, min(1920, self.text_x))
             self.text_y = max(0, min(1080, self.text_y))
             
-            self.update_canvas()
+            # Dragging past the canvas edge keeps producing the same clamped spot
+            if (self.text_x, self.text_y) != old_pos:
+                self._request_drag_flush()
         
         elif self.resizing:
             dx = cx - self.drag_start_x
@@ -807,32 +1077,80 @@ class TextOverlayApp:
                 self.size_var.set(self.font_size)
                 self.drag_start_x = cx
                 self.drag_start_y = cy
-                self.update_canvas()
+                self._request_drag_flush()
+    
+    def _request_drag_flush(self):
+        """Mark the drag state dirty and render it at most once per frame"""
+        self._drag_dirty = True
+        if not self._drag_scheduled:
+            self._drag_scheduled = True
+            self.root.after(16, self._flush_drag)
+    
+    def _flush_drag(self):
+        self._drag_scheduled = False
+        if not self._drag_dirty:
+            return
+        self._drag_dirty = False
+        
+        if self.dragging:
+            drawn_x, drawn_y = self._drawn_text_pos
+            self._drag_delta((self.text_x - drawn_x) * self.scale,
+                             (self.text_y - drawn_y) * self.scale)
+            self._drawn_text_pos = (self.text_x, self.text_y)
+        else:
+            self.update_canvas()
+    
+    def _drag_delta(self, dx, dy):
+        """Shift the already drawn text and selection items instead of redrawing"""
+        self.canvas.move("text_element", dx, dy)
+        self.canvas.move("text_box", dx, dy)
+        self.canvas.move("resize_handle", dx, dy)
+        self.update_status_text()
     
     def on_mouse_up(self, event):
+        was_active = self.dragging or self.resizing
         self.dragging = False
         self.resizing = False
         self.resize_handle = None
+        
+        # The final redraw supersedes any frame still waiting in _flush_drag
+        self._drag_dirty = False
+        if was_active:
+            self.update_canvas()
     
     def on_double_click(self, event):
         self.text_entry.focus_set()
     
     def on_font_change(self):
         self.font_family = self.font_var.get()
-        self.save_config()
-        self.update_canvas()
+        self._schedule_save()
+        self._schedule_redraw(80)
     
     def on_size_change(self):
         try:
-            self.font_size = int(self.size_var.get())
-            self.font_size = max(8, min(500, self.font_size))
-            self.save_config()
-            self.update_canvas()
+            new_size = max(8, min(500, int(self.size_var.get())))
+            if new_size == self.font_size:
+                return
+            self.font_size = new_size
+            self._schedule_save()
+            self._schedule_redraw(80)
         except:
             pass
     
+    def on_text_modified(self, event=None):
+        # Resetting the flag below fires <<Modified>> again; ignore that one
+        if not self.text_entry.edit_modified():
+            return
+        self.text_entry.edit_modified(False)
+        
+        # Fetch the text once per burst of edits rather than on every keystroke
+        self._debounce('_text_after_id', 80, self.on_text_change)
+    
     def on_text_change(self):
-        self.text_content = self.text_entry.get("1.0", tk.END).rstrip('\n')
+        text = self.text_entry.get("1.0", "end-1c")
+        if text == self.text_content:
+            return
+        self.text_content = text
         self.update_canvas()
     
     def center_text(self):
@@ -840,20 +1158,30 @@ class TextOverlayApp:
         self.text_y = 540
         self.update_canvas()
     
+    def set_font_color(self, color):
+        """Set the text color and its cached RGBA tuple used by export"""
+        # Tk resolves names and short forms ("white", "#fff"); unknown colors are ignored
+        try:
+            rgb = bytes(c >> 8 for c in self.root.winfo_rgb(color))
+        except tk.TclError:
+            return
+        self.font_color = "#" + rgb.hex()
+        self.font_color_rgba = (*rgb, 255)
+    
     def pick_color(self):
         color = colorchooser.askcolor(color=self.font_color, title="Choose Text Color")
         if color[1]:
-            self.font_color = color[1]
+            self.set_font_color(color[1])
             self.color_btn.config(bg=self.font_color)
-            self.save_config()
-            self.update_canvas()
+            self._schedule_save()
+            self._schedule_redraw()
     
     def activate_dropper(self):
         self.dropper_active = True
         self.dropper_status.set("Click anywhere on screen to pick color...")
         self.dropper_btn.config(relief=tk.SUNKEN, bg="#FFFF00")
         self.root.config(cursor="crosshair")
-        self.root.after(100, self.start_screen_pick)
+        self.root.after_idle(self.start_screen_pick)
     
     def start_screen_pick(self):
         self.picker_window = tk.Toplevel(self.root)
@@ -872,12 +1200,11 @@ class TextOverlayApp:
         self.picker_window.destroy()
         
         try:
-            img = ImageGrab.grab(bbox=(x, y, x+1, y+1))
-            pixel = img.getpixel((0, 0))
+            pixel = _screen_pixel(x, y)
             
-            self.font_color = "#{:02x}{:02x}{:02x}".format(pixel[0], pixel[1], pixel[2])
+            self.set_font_color("#" + bytes(pixel[:3]).hex())
             self.color_btn.config(bg=self.font_color)
-            self.save_config()
+            self._schedule_save()
             self.update_canvas()
         except Exception as e:
             print(f"Error picking color: {e}")
@@ -895,14 +1222,59 @@ class TextOverlayApp:
         self.dropper_btn.config(relief=tk.RAISED, bg="SystemButtonFace")
         self.root.config(cursor="")
     
-    def find_font_path(self, font_name):
+    @classmethod
+    def _list_font_dir(cls, font_dir):
+        """List a font directory once as (file_lower, file_base, full_path) entries"""
+        listing = cls._font_dir_listings.get(font_dir)
+        if listing is None:
+            listing = []
+            try:
+                with os.scandir(font_dir) as it:
+                    for entry in it:
+                        # DirEntry caches the file type, so this costs no extra stat
+                        if not entry.is_file():
+                            continue
+                        file_lower = entry.name.lower()
+                        file_base = os.path.splitext(file_lower)[0]
+                        listing.append((file_lower, file_base, entry.path))
+            except OSError:
+                pass
+            cls._font_dir_listings[font_dir] = listing
+        return listing
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def find_font_path(font_name):
         """Find the font file path for a given font family name"""
+        # A persisted path stays valid while its directory is unmodified
+        key = font_name.lower().replace(" ", "")
+        cached = TextOverlayApp._font_path_cache.get(key)
+        if cached:
+            try:
+                if os.stat(os.path.dirname(cached['path'])).st_mtime == cached['dir_mtime']:
+                    return cached['path']
+            except (OSError, KeyError, TypeError):
+                pass
+        
+        font_path = TextOverlayApp._scan_font_path(font_name)
+        if font_path:
+            try:
+                dir_mtime = os.stat(os.path.dirname(font_path)).st_mtime
+                TextOverlayApp._font_path_cache[key] = {'path': font_path, 'dir_mtime': dir_mtime}
+                TextOverlayApp._font_path_cache_dirty = True
+            except OSError:
+                pass
+        return font_path
+    
+    @staticmethod
+    def _scan_font_path(font_name):
+        """Search the font directories for a font family's file"""
         font_dirs = [
             "C:/Windows/Fonts",
             os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts"),
         ]
         
-        extensions = ['.ttf', '.otf', '.TTF', '.OTF']
+        extensions = ['.ttf', '.otf', '.ttc', '.TTF', '.OTF', '.TTC']
         
         search_name = font_name.lower().replace(" ", "")
         
@@ -924,43 +1296,40 @@ class TextOverlayApp:
             'calibri': 'calibri',
             'cambria': 'cambria',
             'consolas': 'consola',
+            'microsoftyahei': 'msyh',
         }
         
         mapped_name = font_mappings.get(search_name, search_name)
         
-        for font_dir in font_dirs:
-            if os.path.exists(font_dir):
-                try:
-                    for file in os.listdir(font_dir):
-                        file_lower = file.lower()
-                        file_base = os.path.splitext(file_lower)[0]
-                        
-                        if file_base == mapped_name or file_base == search_name:
-                            for ext in extensions:
-                                if file_lower.endswith(ext.lower()):
-                                    return os.path.join(font_dir, file)
-                        
-                        if mapped_name in file_base or search_name in file_base:
-                            for ext in extensions:
-                                if file_lower.endswith(ext.lower()):
-                                    return os.path.join(font_dir, file)
-                except:
-                    pass
+        font_exts = tuple(ext.lower() for ext in extensions)
+        words = [word for word in font_name.lower().split() if len(word) > 2]
         
+        # Single pass scoring every font file; the first file with the best score wins
+        best_path = None
+        best_score = 0
         for font_dir in font_dirs:
-            if os.path.exists(font_dir):
-                try:
-                    for file in os.listdir(font_dir):
-                        file_lower = file.lower()
-                        for word in font_name.lower().split():
-                            if len(word) > 2 and word in file_lower:
-                                for ext in extensions:
-                                    if file_lower.endswith(ext.lower()):
-                                        return os.path.join(font_dir, file)
-                except:
-                    pass
+            for file_lower, file_base, full_path in TextOverlayApp._list_font_dir(font_dir):
+                if not file_lower.endswith(font_exts):
+                    continue
+                
+                if file_base == mapped_name:
+                    score = 3
+                elif file_base == search_name:
+                    score = 2
+                elif mapped_name in file_base or search_name in file_base:
+                    score = 1
+                elif any(word in file_lower for word in words):
+                    score = 0.5
+                else:
+                    continue
+                
+                if score > best_score:
+                    best_path = full_path
+                    best_score = score
+                    if score == 3:
+                        return best_path
         
-        return None
+        return best_path
     
     def export_png(self):
         path = filedialog.asksaveasfilename(
@@ -979,20 +1348,20 @@ class TextOverlayApp:
         
         try:
             if font_path and os.path.exists(font_path):
-                pil_font = ImageFont.truetype(font_path, self.font_size)
+                pil_font = _pil_font(font_path, self.font_size)
             else:
                 fallbacks = ["arial.ttf", "Arial.ttf", "segoeui.ttf", "tahoma.ttf"]
                 pil_font = None
                 for fb in fallbacks:
                     try:
-                        pil_font = ImageFont.truetype(fb, self.font_size)
+                        pil_font = _pil_font(fb, self.font_size)
                         break
                     except:
                         continue
                 
                 if pil_font is None:
                     try:
-                        pil_font = ImageFont.truetype("C:/Windows/Fonts/arial.ttf", self.font_size)
+                        pil_font = _pil_font("C:/Windows/Fonts/arial.ttf", self.font_size)
                     except:
                         pil_font = ImageFont.load_default()
                 
@@ -1003,61 +1372,56 @@ class TextOverlayApp:
             self.dropper_status.set(f"Font error: {e}")
             self.root.after(3000, lambda: self.dropper_status.set(""))
         
-        hex_color = self.font_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        rgba = rgb + (255,)
+        rgba = self.font_color_rgba
         
-        lines = self.text_content.split('\n')
-        if self.flip_h:
-            lines = [line[::-1] for line in lines]
+        lines = self._display_lines()
         
         bbox = draw.textbbox((0, 0), "Mg", font=pil_font)
         line_height = (bbox[3] - bbox[1]) * self.line_spacing
         
         if self.vertical_stack:
-            all_chars = list(self.text_content.replace('\n', ''))
-            if self.flip_h:
-                all_chars = all_chars[::-1]
+            all_chars = self._display_chars()
             
             total_height = line_height * len(all_chars)
             start_y = self.text_y - total_height / 2
             
+            char_widths = _measure_widths(pil_font, all_chars)
+            
             for i, char in enumerate(all_chars):
-                char_bbox = draw.textbbox((0, 0), char, font=pil_font)
-                char_width = char_bbox[2] - char_bbox[0]
-                char_x = self.text_x - char_width / 2
+                char_x = self.text_x - char_widths[char] / 2
                 char_y = start_y + i * line_height
                 draw.text((char_x, char_y), char, font=pil_font, fill=rgba)
         else:
             total_height = line_height * len(lines)
             start_y = self.text_y - total_height / 2
             
-            line_widths = []
-            for line in lines:
-                if line:
-                    bbox = draw.textbbox((0, 0), line, font=pil_font)
-                    line_widths.append(bbox[2] - bbox[0])
-                else:
-                    line_widths.append(0)
+            line_widths = [pil_font.getlength(line) if line else 0 for line in lines]
             
             max_width = max(line_widths) if line_widths else 0
             
-            for i, line in enumerate(lines):
-                if not line:
-                    continue
-                
-                line_bbox = draw.textbbox((0, 0), line, font=pil_font)
-                line_width = line_bbox[2] - line_bbox[0]
-                line_y = start_y + i * line_height
-                
-                if self.text_align == "left":
-                    line_x = self.text_x - max_width / 2
-                elif self.text_align == "right":
-                    line_x = self.text_x + max_width / 2 - line_width
-                else:
-                    line_x = self.text_x - line_width / 2
+            if not self.flip_h and self.text_align in ("left", "center", "right"):
+                # Let PIL lay out all lines in one call; it steps lines by the
+                # "A" glyph height plus spacing, so derive spacing from that
+                spacing = line_height - pil_font.getbbox("A")[3]
+                draw.multiline_text((self.text_x - max_width / 2, start_y), self.text_content,
+                                    font=pil_font, fill=rgba, align=self.text_align,
+                                    spacing=spacing)
+            else:
+                # line_x = base_x - width_coef * line_width for every alignment
+                block_coef, width_coef = {
+                    "left": (-0.5, 0.0),
+                    "right": (0.5, 1.0),
+                }.get(self.text_align, (0.0, 0.5))
+                base_x = self.text_x + block_coef * max_width
                 
-                draw.text((line_x, line_y), line, font=pil_font, fill=rgba)
+                for i, line in enumerate(lines):
+                    if not line:
+                        continue
+                    
+                    line_x = base_x - width_coef * line_widths[i]
+                    line_y = start_y + i * line_height
+                    
+                    draw.text((line_x, line_y), line, font=pil_font, fill=rgba)
         
         img.save(path, "PNG")
         